@@ -85,7 +85,7 @@ Format your response as JSON with the following structure:
 
             # Parse the response
             test_case_data = response.choices[0].message.content.strip()
-            self.logger.debug(f"Generated test case data: {test_case_data}")
+            self.logger.debug("Generated test case data: %s", test_case_data)
 
             # Create ParsedTestCase object
             parsed_case = ParsedTestCase.parse_raw(test_case_data)
@@ -93,10 +93,10 @@ Format your response as JSON with the following structure:
             # Set expected results from steps
             parsed_case.expected_results = parsed_case.get_expected_results()
             
-            self.logger.info(f"Successfully parsed test case: {parsed_case.name}")
+            self.logger.info("Successfully parsed test case: %s", parsed_case.name)
 
             return parsed_case
 
         except Exception as e:
-            self.logger.error(f"Error parsing requirement: {str(e)}")
+            self.logger.error("Error parsing requirement: %s", e)
             raise
\ No newline at end of file
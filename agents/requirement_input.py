@@ -1,8 +1,12 @@
 """RequirementInputAgent for processing test requirements."""
 import logging
+import re
 from pydantic import BaseModel, Field
 from typing import List, Optional
 
+# Section headers recognised anywhere in a requirement line
+_SECTION_RE = re.compile(r'(acceptance criteria|prerequisites):', re.IGNORECASE)
+
 class RequirementInput(BaseModel):
     """Model for raw test requirements input"""
     raw_text: str
@@ -44,47 +48,39 @@ class RequirementInputAgent:
             lines = requirement.raw_text.strip().split('\n')
             title = lines[0].strip() if lines else "Untitled Test Case"
 
-            # Initialize lists with default empty values
-            description = ""
+            # Collect lines per section; headers switch the current section
+            description = []
             acceptance_criteria = []
             prerequisites = []
+            sections = {
+                "acceptance criteria": acceptance_criteria,
+                "prerequisites": prerequisites
+            }
 
-            current_section = "description"
+            current_section = description
             for line in lines[1:]:
                 line = line.strip()
                 if not line:
                     continue
 
                 # Check for section headers
-                if "acceptance criteria:" in line.lower():
-                    current_section = "acceptance"
-                    continue
-                elif "prerequisites:" in line.lower():
-                    current_section = "prerequisites"
+                header = _SECTION_RE.search(line)
+                if header:
+                    current_section = sections[header.group(1).lower()]
                     continue
 
-                # Add content to appropriate section
-                if current_section == "description":
-                    description += line + " "
-                elif current_section == "acceptance":
-                    if line.startswith("-"):
-                        acceptance_criteria.append(line[1:].strip())
-                    else:
-                        acceptance_criteria.append(line)
-                elif current_section == "prerequisites":
-                    if line.startswith("-"):
-                        prerequisites.append(line[1:].strip())
-                    else:
-                        prerequisites.append(line)
+                # List sections drop a leading bullet; description lines are kept as-is
+                if current_section is not description and line.startswith("-"):
+                    line = line[1:].strip()
+                current_section.append(line)
 
-            # Ensure we have at least empty lists
             return CleanedRequirement(
                 title=title,
-                description=description.strip(),
-                acceptance_criteria=acceptance_criteria or [],  # Ensure we have at least an empty list
-                prerequisites=prerequisites or []  # Ensure we have at least an empty list
+                description=" ".join(description),
+                acceptance_criteria=acceptance_criteria,
+                prerequisites=prerequisites
             )
 
         except Exception as e:
-            self.logger.error(f"Error cleaning requirement: {str(e)}")
+            self.logger.error("Error cleaning requirement: %s", e)
             raise
\ No newline at end of file
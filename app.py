@@ -1,52 +1,180 @@
 """Main application entry point."""
 import os
 import sys
+import atexit
 import logging
-from flask import Flask, render_template, jsonify, request
+import queue
+import threading
+import time
+import orjson
+from flask import Flask, render_template, request
+from flask.json.provider import DefaultJSONProvider
 from flask_cors import CORS
+from logging.handlers import QueueHandler, QueueListener
 from dotenv import load_dotenv
 import traceback
 from integrations.weaviate_integration import WeaviateIntegration
 from integrations.weaviate_schema import WeaviateSchema
 from routes.health import health_bp
 from routes.test_cases import test_cases_bp
+from routes.responses import raw_json_response
+
+class _DroppingQueueHandler(QueueHandler):
+    """Queue handler that drops records instead of blocking when the queue is full
+
+    Only records below WARNING are dropped; warnings and errors that do not
+    fit go straight to the fallback handler. The number of dropped records
+    is logged once the queue has room again.
+    """
+
+    def __init__(self, queue, fallback):
+        super().__init__(queue)
+        self.fallback = fallback
+        self.dropped = 0
+
+    def enqueue(self, record):
+        try:
+            if self.dropped:
+                self.queue.put_nowait(self._dropped_record())
+                self.dropped = 0
+            self.queue.put_nowait(record)
+        except queue.Full:
+            if record.levelno >= logging.WARNING:
+                self.fallback.handle(record)
+            else:
+                self.dropped += 1
+
+    def _dropped_record(self):
+        record = logging.LogRecord(
+            __name__, logging.WARNING, __file__, 0,
+            "Dropped %d log records while the log queue was full",
+            (self.dropped,), None
+        )
+        return self.prepare(record)
+
+def configure_logging():
+    """Send log records through a queue so a background thread does the writes
+
+    Request threads only enqueue records; the writes to stdout happen on
+    the QueueListener thread. Set LOG_UNBUFFERED=1 to write directly from
+    the calling thread instead. LOG_LEVEL sets the root level; unknown values
+    fall back to INFO.
+    """
+    stream_handler = logging.StreamHandler(sys.stdout)
+    stream_handler.setFormatter(
+        logging.Formatter('%(asctime)s - %(name)s - %(levelname)s - %(message)s')
+    )
+
+    if os.environ.get("LOG_UNBUFFERED") == "1":
+        handlers = [stream_handler]
+    else:
+        log_queue = queue.Queue(maxsize=LOG_QUEUE_SIZE)
+        listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+        listener.start()
+        # Drain queued records on shutdown
+        atexit.register(listener.stop)
+        handlers = [_DroppingQueueHandler(log_queue, stream_handler)]
+
+    level = logging.getLevelName(os.environ.get("LOG_LEVEL", "INFO").upper())
+    if not isinstance(level, int):
+        level = logging.INFO
+    logging.basicConfig(level=level, handlers=handlers)
 
 # Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-    handlers=[
-        logging.StreamHandler(sys.stdout)
-    ]
-)
+LOG_QUEUE_SIZE = 10_000
+configure_logging()
 logger = logging.getLogger(__name__)
 
 # Load environment variables
 load_dotenv()
 logger.info("Environment variables loaded")
 
+class OrjsonProvider(DefaultJSONProvider):
+    """JSON provider that serializes responses and parses request bodies with orjson"""
+
+    def loads(self, s, **kwargs):
+        return orjson.loads(s)
+
+    def dumps(self, obj, **kwargs):
+        return orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS).decode()
+
+    def response(self, *args, **kwargs):
+        obj = self._prepare_response_obj(args, kwargs)
+        return self._app.response_class(
+            orjson.dumps(obj, default=self.default, option=orjson.OPT_NON_STR_KEYS),
+            mimetype=self.mimetype
+        )
+
 # Create Flask app
 app = Flask(__name__)
+app.json = OrjsonProvider(app)
 CORS(app)
 
-# Initialize Weaviate client
-try:
-    weaviate_client = WeaviateIntegration()
-    app.config['weaviate_client'] = weaviate_client
-    logger.info("Weaviate client initialized")
-except Exception as e:
-    logger.error(f"Failed to initialize Weaviate client: {str(e)}")
-    app.config['weaviate_client'] = None
+# Set once the integrations are up; requests only pay an Event.is_set() after that
+_init_done = threading.Event()
+_init_lock = threading.Lock()
+INIT_RETRY_INTERVAL = 30
+_last_init_attempt = 0.0
+
+def init_integrations():
+    """Connect the Weaviate client and publish it in the app config"""
+    global _last_init_attempt
+    _last_init_attempt = time.monotonic()
+    try:
+        app.config['weaviate_client'] = WeaviateIntegration()
+        _init_done.set()
+        logger.info("Weaviate client initialized")
+    except Exception as e:
+        logger.error("Failed to initialize Weaviate client: %s", e)
+        app.config['weaviate_client'] = None
+
+def close_integrations():
+    """Flush queued writes and close the shared Weaviate client at exit"""
+    client = app.config.get('weaviate_client')
+    if client is not None:
+        client.close()
+
+# Initialize Weaviate client; it lives for the whole process
+init_integrations()
+atexit.register(close_integrations)
 
 # Register blueprints
 app.register_blueprint(health_bp)
 app.register_blueprint(test_cases_bp)
 
+@app.before_request
+def ensure_integrations():
+    """Retry a failed startup connection until it succeeds
+
+    At most one request retries at a time, and only every INIT_RETRY_INTERVAL
+    seconds; the rest are served straight away instead of queueing behind it.
+    Routes only read app.config['weaviate_client'] and answer 503 while it
+    is None, so a failed connection is not retried on every request.
+    """
+    if _init_done.is_set():
+        return
+    if time.monotonic() - _last_init_attempt < INIT_RETRY_INTERVAL:
+        return
+    if not _init_lock.acquire(blocking=False):
+        return
+    try:
+        if not _init_done.is_set():
+            init_integrations()
+    finally:
+        _init_lock.release()
+
 @app.before_request
 def log_request_info():
     """Log details about each request"""
-    logger.debug('Headers: %s', request.headers)
-    logger.debug('Body: %s', request.get_data())
+    # Formatting headers is only worth it when DEBUG is on; the body is left
+    # for the handler to read and parse once
+    if logger.isEnabledFor(logging.DEBUG):
+        logger.debug('Headers: %s', request.headers)
+        logger.debug('Body length: %s', request.content_length)
+
+# Fixed error bodies, encoded once at import
+_ERR_NOT_FOUND = orjson.dumps({"error": "Not found"})
+_ERR_INTERNAL = orjson.dumps({"error": "Internal server error"})
 
 @app.route('/')
 def index():
@@ -54,41 +182,34 @@ def index():
     try:
         logger.debug("Rendering index page")
         return render_template('index.html')
-    except Exception as e:
-        logger.error(f"Error rendering index page: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
-
-@app.route('/test-cases')
-def test_cases_page():
-    """Render test cases management page"""
-    try:
-        logger.debug("Rendering test cases page")
-        return render_template('test_cases.html')
-    except Exception as e:
-        logger.error(f"Error rendering test cases page: {str(e)}")
-        return jsonify({"error": "Internal server error"}), 500
+    except Exception:
+        logger.exception("Error rendering index page")
+        return raw_json_response(_ERR_INTERNAL, 500)
 
 @app.errorhandler(404)
 def not_found(error):
-    logger.warning(f"404 error: {str(error)}")
-    return jsonify({"error": "Not found"}), 404
+    logger.warning("404 error: %s", error)
+    return raw_json_response(_ERR_NOT_FOUND, 404)
 
 @app.errorhandler(500)
 def server_error(error):
-    logger.error(f"Server error: {str(error)}")
-    return jsonify({"error": "Internal server error"}), 500
+    logger.error("Server error: %s", error)
+    return raw_json_response(_ERR_INTERNAL, 500)
 
 if __name__ == "__main__":
     try:
         # Get port from environment variable with default to 5000
         port = int(os.environ.get('PORT', 5000))
-        logger.info(f"Starting Flask server on port {port}")
+        logger.info("Starting Flask server on port %s", port)
 
+        # Debugger and reloader are for local development only
+        debug = os.environ.get('FLASK_ENV') == 'development'
         app.run(
             host='0.0.0.0',
             port=port,
-            debug=True
+            debug=debug,
+            use_reloader=debug
         )
     except Exception as e:
-        logger.error(f"Failed to start app: {str(e)}")
+        logger.error("Failed to start app: %s", e)
         sys.exit(1)
\ No newline at end of file
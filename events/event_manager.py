@@ -25,7 +25,7 @@ class EventManager:
         if event_type not in self._subscribers:
             self._subscribers[event_type] = set()
         self._subscribers[event_type].add(callback)
-        self._logger.debug(f"Subscribed to {event_type}")
+        self._logger.debug("Subscribed to %s", event_type)
 
     def unsubscribe(self, event_type: str, callback: Callable) -> None:
         """Unsubscribe from specific event type
@@ -38,7 +38,7 @@ class EventManager:
             self._subscribers[event_type].discard(callback)
             if not self._subscribers[event_type]:
                 del self._subscribers[event_type]
-            self._logger.debug(f"Unsubscribed from {event_type}")
+            self._logger.debug("Unsubscribed from %s", event_type)
 
     def publish(self, event: Event) -> None:
         """Publish an event to all subscribers
@@ -52,8 +52,8 @@ class EventManager:
                 try:
                     callback(event)
                 except Exception as e:
-                    self._logger.error(f"Error in event callback: {str(e)}")
-        self._logger.debug(f"Published event: {event_type}")
+                    self._logger.error("Error in event callback: %s", e)
+        self._logger.debug("Published event: %s", event_type)
 
     def get_subscribers(self, event_type: str) -> Set[Callable]:
         """Get all subscribers for an event type
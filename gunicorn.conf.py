@@ -0,0 +1,27 @@
+"""Gunicorn settings for serving the Flask app (loaded automatically from the project root)."""
+import os
+
+bind = f"0.0.0.0:{os.environ.get('PORT', 5000)}"
+
+# Requests spend most of their time waiting on Weaviate, Zephyr and OpenAI,
+# so each worker runs a pool of threads that overlap that I/O
+worker_class = "gthread"
+workers = int(os.environ.get("WEB_CONCURRENCY", 2))
+threads = int(os.environ.get("GUNICORN_THREADS", 8))
+
+# Test case generation waits on the LLM; leave headroom over its latency
+timeout = 120
+keepalive = 5
+
+def on_starting(server):
+    """Refuse async inserts with several workers
+
+    Queued write status (WEAVIATE_ASYNC_INSERT) lives in the worker that
+    queued the write, so the status route only answers reliably with one.
+    Checked here so a -w flag on the command line is covered too.
+    """
+    if os.environ.get("WEAVIATE_ASYNC_INSERT") == "1" and server.cfg.workers > 1:
+        raise RuntimeError(
+            "WEAVIATE_ASYNC_INSERT=1 requires a single worker (WEB_CONCURRENCY=1); "
+            f"got {server.cfg.workers}, which cannot see each other's queued writes"
+        )
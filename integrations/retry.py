@@ -0,0 +1,45 @@
+"""Retry helper with capped, jittered backoff for remote calls."""
+import logging
+import random
+import time
+from typing import Callable, Tuple, Type, TypeVar
+
+T = TypeVar("T")
+
+logger = logging.getLogger(__name__)
+
+def retry(
+    fn: Callable[[], T],
+    attempts: int = 3,
+    base: float = 0.25,
+    cap: float = 5.0,
+    exceptions: Tuple[Type[BaseException], ...] = (Exception,)
+) -> T:
+    """Call fn, retrying failures with decorrelated jitter backoff
+
+    Each delay is drawn from uniform(base, previous_delay * 3) and capped,
+    so clients that fail together do not retry in lockstep.
+
+    Args:
+        fn: Zero-argument callable to invoke
+        attempts: Total number of calls before giving up
+        base: Minimum delay between attempts in seconds
+        cap: Maximum delay between attempts in seconds
+        exceptions: Exception types that trigger a retry; others propagate immediately
+
+    Returns:
+        Result of the first successful call
+    """
+    delay = base
+    for attempt in range(1, attempts + 1):
+        try:
+            return fn()
+        except exceptions as e:
+            if attempt == attempts:
+                raise
+            delay = min(cap, random.uniform(base, delay * 3))
+            logger.warning(
+                "Attempt %d/%d failed: %s; retrying in %.2fs",
+                attempt, attempts, e, delay
+            )
+            time.sleep(delay)
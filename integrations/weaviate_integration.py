@@ -1,21 +1,43 @@
 """Weaviate integration for storing and retrieving test cases."""
 import os
+import atexit
 import logging
-from typing import Dict, List, Optional, Union, Literal
+import queue
+import threading
+import time
+import uuid
+from typing import Callable, Dict, List, Optional, Sequence, Union, Literal
 from dataclasses import dataclass
 from enum import Enum
 import weaviate
 from weaviate.classes.init import Auth, AdditionalConfig, Timeout
+from weaviate.config import ConnectionConfig
+from weaviate.classes.config import ConsistencyLevel
+from weaviate.exceptions import (
+    UnexpectedStatusCodeError,
+    WeaviateConnectionError,
+    WeaviateStartUpError
+)
 from weaviate.collections.classes.config import (
     Configure, 
     Property,
     DataType
 )
-from weaviate.classes.query import MetadataQuery
+from weaviate.classes.data import DataObject
+from weaviate.classes.query import MetadataQuery, Filter, Sort
+from weaviate.util import generate_uuid5
 from .weaviate_schema import WeaviateSchema
+from .cache import TTLCache
+from .retry import retry
 from datetime import datetime
 from dotenv import load_dotenv
 
+# Test case reads favour latency over read-your-write consistency across replicas
+READ_CONSISTENCY = ConsistencyLevel.ONE
+
+# Errors worth retrying; anything else (bad config, bad query) fails fast
+_TRANSIENT_ERRORS = (WeaviateConnectionError, WeaviateStartUpError, ConnectionError, TimeoutError)
+
 class SearchType(Enum):
     EXACT = "exact"
     SEMANTIC = "semantic"
@@ -41,11 +63,71 @@ class WeaviateIntegration:
         "automation_status", "created_at", "updated_at"
     ]
     DEFAULT_SEARCH_LIMIT = 5
+    INGEST_QUEUE_SIZE = 10_000
+    # Outcome of queued writes: pending until sent, failed if Weaviate rejected
+    # them, duplicate if the name was already stored
+    WRITE_STATUS_SIZE = 2 * INGEST_QUEUE_SIZE
+    WRITE_STATUS_TTL = 3600
+    LOOKUP_CACHE_SIZE = 4096
+    # Writes only invalidate this process's cache; a short TTL bounds how
+    # long other gunicorn workers can serve a test case changed or deleted elsewhere
+    LOOKUP_HIT_TTL = 60
+    HEALTH_TTL = 5
+    # Sized for gunicorn gthread workers sharing the one client
+    POOL_CONNECTIONS = 20
+    POOL_MAXSIZE = 50
+
+    # Process-wide shared instance
+    _instance = None
+    _lock = threading.Lock()
+    _schema_checked = False
+
+    def __new__(cls, *args, **kwargs):
+        with cls._lock:
+            # Replace the instance only after close(); one that is still
+            # connecting, or failed to, is reused and __init__ connects it
+            instance = cls._instance
+            if instance is None or (instance._initialized and instance.client is None):
+                instance = cls._instance = super(WeaviateIntegration, cls).__new__(cls)
+                instance._initialized = False
+                instance.client = None
+            return instance
+
+    def __init__(self, async_insert: Optional[bool] = None, batch_len: int = 256, flush_interval_ms: int = 100):
+        """Initialize Weaviate client with configuration
+
+        The client is created once per process; later instantiations return
+        the same connected instance.
+
+        Args:
+            async_insert: If True, store_test_case queues objects and a background
+                thread sends them to Weaviate in batches. Defaults to the
+                WEAVIATE_ASYNC_INSERT environment variable ("1" enables it)
+            batch_len: Max number of queued objects sent in a single batch
+            flush_interval_ms: Max time to wait for a batch to fill before sending
+        """
+        if async_insert is None:
+            async_insert = os.environ.get("WEAVIATE_ASYNC_INSERT") == "1"
+
+        with self._lock:
+            if not self._initialized:
+                self._connect()
+                self._initialized = True
+
+            if async_insert and self._ingest_q is None:
+                self._start_ingest(batch_len, flush_interval_ms)
 
-    def __init__(self):
-        """Initialize Weaviate client with configuration"""
+    def _connect(self):
+        """Connect to Weaviate Cloud and make sure the schema exists"""
         self.logger = logging.getLogger(__name__)
         self.client = None
+        self.schema_manager = None
+        self._ingest_q = None
+        self._ingest_thread = None
+        self._write_status = TTLCache(maxsize=self.WRITE_STATUS_SIZE, ttl=self.WRITE_STATUS_TTL)
+        self._lookup_cache = TTLCache(maxsize=self.LOOKUP_CACHE_SIZE, ttl=self.LOOKUP_HIT_TTL)
+        self._healthy_until = 0.0
+        self._health_lock = threading.Lock()
 
         try:
             # Get credentials from environment
@@ -57,9 +139,9 @@ class WeaviateIntegration:
             if not all([weaviate_url, weaviate_api_key, openai_api_key]):
                 raise ValueError("Missing required environment variables")
 
-            self.logger.info(f"Connecting to Weaviate Cloud at: {weaviate_url}")
+            self.logger.info("Connecting to Weaviate Cloud at: %s", weaviate_url)
 
-            # Initialize client using v4 Cloud API
+            # Build the client once; only the readiness probe below is retried
             self.client = weaviate.connect_to_weaviate_cloud(
                 cluster_url=weaviate_url,
                 auth_credentials=Auth.api_key(weaviate_api_key),
@@ -71,21 +153,202 @@ class WeaviateIntegration:
                         init=30,    # Connection timeout
                         query=60,   # Query operations timeout
                         insert=120  # Insert operations timeout
+                    ),
+                    connection=ConnectionConfig(
+                        session_pool_connections=self.POOL_CONNECTIONS,
+                        session_pool_maxsize=self.POOL_MAXSIZE
                     )
-                )
+                ),
+                skip_init_checks=True
             )
 
-            if self.is_healthy():
-                self.logger.info("✅ Connected to Weaviate Cloud")
-                schema_manager = WeaviateSchema(self.client)
-                schema_manager.ensure_schema()
-            else:
-                raise Exception("Failed to connect to Weaviate Cloud")
+            # Network blips are retried with backoff; a rejected API key is not
+            retry(self._wait_until_ready, exceptions=_TRANSIENT_ERRORS)
+
+            self.logger.info("✅ Connected to Weaviate Cloud")
+            self.schema_manager = WeaviateSchema(self.client)
+            if not WeaviateIntegration._schema_checked:
+                self.schema_manager.ensure_schema()
+                WeaviateIntegration._schema_checked = True
 
         except Exception as e:
-            self.logger.error(f"❌ Initialization failed: {str(e)}")
+            self.logger.error("❌ Initialization failed: %s", e)
+            if self.client:
+                self.client.close()
+                self.client = None
             raise
 
+    def _wait_until_ready(self):
+        """Check the cluster is up and accepts our credentials
+
+        Raises:
+            WeaviateStartUpError: If the cluster is not ready yet (transient)
+            UnexpectedStatusCodeError: If the credentials are rejected (permanent)
+        """
+        if not self.client.is_ready():
+            raise WeaviateStartUpError("Weaviate cluster is not ready yet")
+        # /ready is unauthenticated; /meta is not, so a bad key fails here
+        self.client.get_meta()
+
+    def _read_collection(self):
+        """Return the TestCase collection configured for reads
+
+        Reads are answered by a single replica (ConsistencyLevel.ONE) rather
+        than waiting for a quorum, so on a replicated cluster they are not
+        held up by replicas busy with writes. Writes keep the default level.
+        """
+        return self.client.collections.get("TestCase").with_consistency_level(
+            READ_CONSISTENCY
+        )
+
+    def _start_ingest(self, batch_len: int, flush_interval_ms: int):
+        """Start the background thread that drains queued test cases"""
+        self._batch_len = batch_len
+        self._flush_interval = flush_interval_ms / 1000
+        self._ingest_q = queue.Queue(maxsize=self.INGEST_QUEUE_SIZE)
+        self._ingest_thread = threading.Thread(
+            target=self._drain,
+            name="weaviate-ingest",
+            daemon=True
+        )
+        self._ingest_thread.start()
+        atexit.register(self.flush)
+
+    def _drain(self):
+        """Send queued test cases every batch_len items or flush_interval_ms"""
+        while True:
+            # Block until there is work, then collect until the batch fills or times out
+            items = [self._ingest_q.get()]
+            deadline = time.monotonic() + self._flush_interval
+            while len(items) < self._batch_len:
+                remaining = deadline - time.monotonic()
+                if remaining <= 0:
+                    break
+                try:
+                    items.append(self._ingest_q.get(timeout=remaining))
+                except queue.Empty:
+                    break
+
+            try:
+                failed, duplicates = self._send_batch([item[:2] for item in items])
+            except Exception:
+                self.logger.error("Error sending queued test cases", exc_info=True)
+                failed, duplicates = set(range(len(items))), set()
+
+            stored = {
+                item[0] for position, item in enumerate(items)
+                if position not in failed and position not in duplicates
+            }
+            for position, (object_id, _, on_stored, on_duplicate) in enumerate(items):
+                if position in failed:
+                    self._write_status.set(object_id, "failed")
+                elif position in duplicates:
+                    # Another item with this name may have been stored by this batch
+                    if object_id not in stored:
+                        self._write_status.set(object_id, "duplicate")
+                    self._notify(on_duplicate, object_id)
+                else:
+                    self._write_status.pop(object_id)
+                    self._notify(on_stored, object_id)
+                self._ingest_q.task_done()
+
+    def _send_batch(self, items: List[tuple], batch_size: Optional[int] = None) -> tuple:
+        """Send (uuid, properties) pairs to Weaviate
+
+        A single object goes through data.insert; lists go through
+        data.insert_many, whose errors belong to that call alone, so
+        concurrent writers cannot see each other's failures.
+
+        UUIDs come from test case names, so an existing UUID means the name
+        is taken. Such objects are not written, leaving the stored test case
+        untouched. insert_many would overwrite them, so lists are checked
+        against Weaviate first.
+
+        Returns:
+            tuple: Positions in items that Weaviate failed to store, and
+                positions skipped because their name is already taken
+        """
+        collection = self.client.collections.get("TestCase")
+        failed = set()
+        duplicates = set()
+
+        if len(items) == 1:
+            object_id, properties = items[0]
+            try:
+                collection.data.insert(properties=properties, uuid=object_id)
+            except UnexpectedStatusCodeError as e:
+                # 422 is also returned for invalid objects; only skip real duplicates
+                if e.status_code == 422 and "already exists" in str(e):
+                    duplicates.add(0)
+                else:
+                    self.logger.error("Failed to store test case %s: %s", object_id, e)
+                    failed.add(0)
+            except Exception as e:
+                self.logger.error("Failed to store test case %s: %s", object_id, e)
+                failed.add(0)
+        else:
+            step = batch_size or len(items)
+            for start in range(0, len(items), step):
+                positions = range(start, min(start + step, len(items)))
+                try:
+                    existing = self._existing_ids(collection, [items[i][0] for i in positions])
+                    chunk = []
+                    for i in positions:
+                        # Names already stored, or repeated earlier in this call
+                        if items[i][0] in existing:
+                            duplicates.add(i)
+                        else:
+                            existing.add(items[i][0])
+                            chunk.append(i)
+                    if not chunk:
+                        continue
+                    result = collection.data.insert_many([
+                        DataObject(properties=items[i][1], uuid=items[i][0]) for i in chunk
+                    ])
+                except Exception as e:
+                    # Earlier chunks are already stored; only this one is lost
+                    self.logger.error("Failed to store %d test cases: %s", len(positions), e)
+                    failed.update(positions)
+                    duplicates.difference_update(positions)
+                    continue
+                failed.update(chunk[index] for index in result.errors)
+
+        if duplicates:
+            self.logger.warning("Skipped %d test cases whose name already exists", len(duplicates))
+        if failed:
+            self.logger.error("Failed to store %d of %d test cases", len(failed), len(items))
+        else:
+            self.logger.info("Stored %d test cases", len(items) - len(duplicates))
+        return failed, duplicates
+
+    @staticmethod
+    def _existing_ids(collection, object_ids: List[str]) -> set:
+        """Return the subset of object_ids that already exist in the collection"""
+        response = collection.query.fetch_objects(
+            filters=Filter.by_id().contains_any(object_ids),
+            limit=len(object_ids),
+            return_properties=[]
+        )
+        return {str(obj.uuid) for obj in response.objects}
+
+    @property
+    def queues_writes(self) -> bool:
+        """Whether store_test_case returns before the write reaches Weaviate"""
+        return self._ingest_q is not None
+
+    def write_status(self, object_id: str) -> Optional[str]:
+        """Return "pending", "failed" or "duplicate" for a queued write
+
+        Returns None once the write has been stored, or if the UUID was
+        never queued by this process.
+        """
+        return self._write_status.get(object_id)
+
+    def flush(self):
+        """Block until all queued test cases have been sent to Weaviate"""
+        if self._ingest_q is not None:
+            self._ingest_q.join()
+
     def _create_schema(self):
         """Create test case schema in Weaviate"""
         try:
@@ -175,43 +438,117 @@ class WeaviateIntegration:
             )
             self.logger.info("✅ New schema created successfully")
         except Exception as e:
-            self.logger.error(f"❌ Error creating schema: {str(e)}")
+            self.logger.error("❌ Error creating schema: %s", e)
             raise
 
-    def store_test_case(self, test_case: dict) -> Optional[str]:
-        """Store a test case in Weaviate"""
+    def _notify(self, callback: Optional[Callable[[str], None]], object_id: str):
+        """Run a caller's callback, logging instead of raising its errors"""
+        if callback is None:
+            return
         try:
-            self.logger.info(f"Attempting to store test case: {test_case}")
-            
-            # Get TestCase collection
-            test_cases = self.client.collections.get("TestCase")
-            
-            # Add timestamps if not present
-            if 'created_at' not in test_case:
-                test_case['created_at'] = datetime.now().isoformat()
-            if 'updated_at' not in test_case:
-                test_case['updated_at'] = datetime.now().isoformat()
-            
-            # Store the object
-            result = test_cases.data.insert(test_case)
-            
-            # In Weaviate v4, the UUID is returned directly as a string
-            if result:
-                self.logger.info(f"Successfully stored test case with ID: {result}")
-                return str(result)  # Convert UUID to string
-            else:
-                self.logger.error("Failed to get UUID from Weaviate insert")
-                return None
+            callback(object_id)
+        except Exception:
+            self.logger.error("Store callback failed for %s", object_id, exc_info=True)
+
+    def store_test_case(
+        self,
+        test_case: dict,
+        on_stored: Optional[Callable[[str], None]] = None,
+        on_duplicate: Optional[Callable[[str], None]] = None
+    ) -> Optional[str]:
+        """Store a test case in Weaviate
+
+        With async_insert enabled the test case is queued and its
+        pre-assigned UUID is returned before it reaches Weaviate.
+        on_stored is called with the UUID once Weaviate has stored it, and
+        on_duplicate if a test case with the same name already exists.
+        """
+        return self.store_test_cases(
+            [test_case], on_stored=[on_stored], on_duplicate=[on_duplicate]
+        )[0]
+
+    @staticmethod
+    def _object_id(test_case: dict) -> str:
+        """Deterministic UUID for a named test case, random otherwise"""
+        name = test_case.get('name')
+        if name:
+            return generate_uuid5(name, "TestCase")
+        return str(uuid.uuid4())
+
+    def store_test_cases(
+        self,
+        test_cases: List[dict],
+        batch_size: int = 100,
+        on_stored: Optional[List[Optional[Callable[[str], None]]]] = None,
+        on_duplicate: Optional[List[Optional[Callable[[str], None]]]] = None
+    ) -> List[Optional[str]]:
+        """Store several test cases with Weaviate insert_many requests
+
+        Named test cases get a UUID derived from their name. A test case
+        whose name is already stored is not written; on_duplicate reports it
+        and the stored test case is left as it was.
+
+        Args:
+            test_cases: Test cases in Weaviate format
+            batch_size: Number of objects sent per insert_many request
+            on_stored: Callbacks matching test_cases (or None entries), each
+                called with its test case's UUID once Weaviate has stored it.
+                For queued writes they run on the ingest thread, so they should
+                hand slow work to another thread
+            on_duplicate: Callbacks matching test_cases, each called with the
+                name-derived UUID if that name is already stored. Queued
+                duplicates also get the "duplicate" write status
+
+        Returns:
+            UUID for each test case, or None where it was rejected or its
+            name is already stored
+        """
+        try:
+            self.logger.info("Attempting to store %d test case(s)", len(test_cases))
+
+            now = datetime.now().isoformat()
+            items = []
+            for test_case in test_cases:
+                # Timestamps only fill gaps (TestCase.to_weaviate_format sets both;
+                # plain dicts from scripts may not), on a copy of the caller's dict
+                properties = {'created_at': now, 'updated_at': now, **test_case}
+                items.append((self._object_id(properties), properties))
+
+            # Cached lookups for these names may now be stale
+            names = {test_case.get('name') for test_case in test_cases}
+            self._lookup_cache.discard_if(lambda key, value: key[0] in names)
+
+            on_stored = on_stored or [None] * len(items)
+            on_duplicate = on_duplicate or [None] * len(items)
+
+            if self._ingest_q is not None:
+                for (object_id, properties), stored_cb, duplicate_cb in zip(items, on_stored, on_duplicate):
+                    self._write_status.set(object_id, "pending")
+                    self._ingest_q.put((object_id, properties, stored_cb, duplicate_cb))
+                return [object_id for object_id, _ in items]
+
+            failed, duplicates = self._send_batch(items, batch_size)
+            case_ids = []
+            for position, (object_id, _) in enumerate(items):
+                if position in failed:
+                    case_ids.append(None)
+                elif position in duplicates:
+                    self._notify(on_duplicate[position], object_id)
+                    case_ids.append(None)
+                else:
+                    self._notify(on_stored[position], object_id)
+                    case_ids.append(object_id)
+            return case_ids
 
         except Exception as e:
-            self.logger.error(f"Error storing test case: {str(e)}", exc_info=True)
+            self.logger.error("Error storing test cases: %s", e, exc_info=True)
             raise
 
     def search_test_cases(
         self,
         query: str,
         search_type: SearchType = SearchType.HYBRID,
-        properties: List[str] = None,
+        properties: Sequence[str] = None,
         filters: List[SearchFilter] = None,
         sort_by: str = None,
         sort_order: SortOrder = SortOrder.DESC,
@@ -224,7 +561,7 @@ class WeaviateIntegration:
         Args:
             query: Search query text
             search_type: Type of search (exact, semantic, or hybrid)
-            properties: Properties to return
+            properties: Properties to return; request only what the caller displays
             filters: List of filters to apply
             sort_by: Field to sort by
             sort_order: Sort direction
@@ -238,9 +575,9 @@ class WeaviateIntegration:
             - metadata: Search metadata (total, page, etc.)
         """
         try:
-            self.logger.info(f"Performing {search_type.value} search for: {query}")
-            collection = self.client.collections.get("TestCase")
-            properties = properties or self.DEFAULT_PROPERTIES
+            self.logger.info("Performing %s search for: %s", search_type.value, query)
+            collection = self._read_collection()
+            properties = list(properties) if properties else self.DEFAULT_PROPERTIES
             
             # Build search parameters
             search_params = {
@@ -252,51 +589,45 @@ class WeaviateIntegration:
 
             # Add filters if provided
             if filters:
-                where_filter = {"operator": "And", "operands": []}
-                for f in filters:
-                    where_filter["operands"].append({
-                        "path": [f.field],
-                        "operator": f.operator,
-                        "valueText": f.value if isinstance(f.value, str) else None,
-                        "valueInt": f.value if isinstance(f.value, int) else None,
-                        "valueNumber": f.value if isinstance(f.value, float) else None,
-                        "valueDate": f.value if isinstance(f.value, datetime) else None
-                    })
-                search_params["where_filter"] = where_filter
-
-            # Add sorting
-            if sort_by:
-                search_params["sort"] = {
-                    "path": [sort_by],
-                    "order": sort_order.value
-                }
+                search_params["filters"] = Filter.all_of(
+                    [self._build_filter(f) for f in filters]
+                )
 
             # Perform search based on type
             if search_type == SearchType.EXACT:
-                results = collection.query.get(**search_params)
+                # Sorting is only supported on plain object fetches
+                if sort_by:
+                    search_params["sort"] = Sort.by_property(
+                        sort_by,
+                        ascending=sort_order == SortOrder.ASC
+                    )
+                run_query = lambda: collection.query.fetch_objects(**search_params)
             elif search_type == SearchType.SEMANTIC:
-                results = collection.query.near_text(
+                run_query = lambda: collection.query.near_text(
                     query=query,
                     **search_params
                 )
             else:  # HYBRID
                 # Combine BM25 and vector search
-                results = collection.query.hybrid(
+                run_query = lambda: collection.query.hybrid(
                     query=query,
                     alpha=0.5,  # Balance between keyword and vector search
                     **search_params
                 )
+            results = retry(run_query, exceptions=_TRANSIENT_ERRORS)
 
             # Process results
             processed_results = []
             for obj in results.objects:
-                if not hasattr(obj.metadata, 'distance') or obj.metadata.distance >= min_score:
+                # v4 only populates distance for vector searches
+                distance = obj.metadata.distance
+                if distance is None or distance >= min_score:
                     result = {
                         'properties': obj.properties,
                         'id': obj.id
                     }
-                    if hasattr(obj.metadata, 'distance'):
-                        result['score'] = obj.metadata.distance
+                    if distance is not None:
+                        result['score'] = distance
                     processed_results.append(result)
 
             # Return results with metadata
@@ -312,36 +643,81 @@ class WeaviateIntegration:
             }
 
         except Exception as e:
-            self.logger.error(f"Search failed: {str(e)}", exc_info=True)
+            self.logger.error("Search failed: %s", e, exc_info=True)
             raise
 
+    @staticmethod
+    def _build_filter(search_filter: SearchFilter):
+        """Convert a SearchFilter into a v4 Filter expression"""
+        prop = Filter.by_property(search_filter.field)
+        operator = search_filter.operator
+        value = search_filter.value
+
+        if operator == "WithinRange":
+            low, high = value
+            return Filter.all_of([prop.greater_or_equal(low), prop.less_or_equal(high)])
+
+        builders = {
+            "Equal": prop.equal,
+            "NotEqual": prop.not_equal,
+            "GreaterThan": prop.greater_than,
+            "GreaterThanEqual": prop.greater_or_equal,
+            "LessThan": prop.less_than,
+            "LessThanEqual": prop.less_or_equal,
+            "Like": prop.like
+        }
+        return builders[operator](value)
+
     def get_test_case_by_id(self, id: str, properties: List[str] = None) -> Optional[Dict]:
         """Get test case by ID"""
         try:
-            collection = self.client.collections.get("TestCase")
+            collection = self._read_collection()
             properties = properties or self.DEFAULT_PROPERTIES
             
-            result = collection.query.get_by_id(
-                uuid=id,
-                return_properties=properties
+            result = retry(
+                lambda: collection.query.fetch_object_by_id(
+                    uuid=id,
+                    return_properties=properties
+                ),
+                exceptions=_TRANSIENT_ERRORS
             )
             
             return result.properties if result else None
         except Exception as e:
-            self.logger.error(f"Failed to get test case by ID: {str(e)}")
+            self.logger.error("Failed to get test case by ID: %s", e)
             raise
 
-    def is_healthy(self):
-        """Check if Weaviate connection is healthy"""
-        try:
-            return self.client.is_ready()
-        except Exception:
-            return False
+    def is_healthy(self, force: bool = False):
+        """Check if Weaviate connection is healthy
+
+        A successful probe is reused for HEALTH_TTL seconds so callers that
+        check before every query share one round trip. Failures are not
+        cached, so the next call probes again and notices recovery at once.
+
+        Args:
+            force: Probe Weaviate even if a recent probe succeeded
+        """
+        if not force and time.monotonic() < self._healthy_until:
+            return True
+
+        with self._health_lock:
+            # Another thread may have refreshed the flag while we waited
+            if not force and time.monotonic() < self._healthy_until:
+                return True
+            try:
+                healthy = self.client.is_ready()
+            except Exception:
+                healthy = False
+            self._healthy_until = time.monotonic() + self.HEALTH_TTL if healthy else 0.0
+            return healthy
 
     def close(self):
         """Close the Weaviate client connection"""
+        self.flush()
+        self._healthy_until = 0.0
         if self.client:
             self.client.close()
+            self.client = None
 
     def __del__(self):
         """Ensure client is properly closed"""
@@ -358,27 +734,45 @@ class WeaviateIntegration:
             limit: Maximum number of results to return
         """
         try:
-            self.logger.info(f"Attempting to retrieve test case with {'semantic search' if semantic else 'exact match'}: {name}")
+            self.logger.info("Attempting to retrieve test case with %s: %s", 'semantic search' if semantic else 'exact match', name)
             
-            test_cases = self.client.collections.get("TestCase")
+            test_cases = self._read_collection()
             properties = properties or self.DEFAULT_PROPERTIES
-            
+
+            if not semantic:
+                cache_key = (name, tuple(properties))
+                cached = self._lookup_cache.get(cache_key)
+                if cached is not None:
+                    return cached
+
+                # Primary-key lookup on the UUID derived from the name at store time
+                obj = retry(
+                    lambda: test_cases.query.fetch_object_by_id(
+                        uuid=generate_uuid5(name, "TestCase"),
+                        return_properties=properties
+                    ),
+                    exceptions=_TRANSIENT_ERRORS
+                )
+                if obj is not None:
+                    self.logger.info("✅ Successfully retrieved test case(s)")
+                    self._lookup_cache.set(cache_key, obj.properties)
+                    return obj.properties
+
             if semantic:
-                results = test_cases.query.near_text(
+                run_query = lambda: test_cases.query.near_text(
                     query=name,
                     limit=limit,
                     return_metadata=MetadataQuery(distance=True),
                     return_properties=properties
                 )
             else:
-                results = test_cases.query.get(
-                    filters={
-                        "path": ["name"],
-                    "operator": "Equal",
-                    "valueString": name
-                    },
+                # Objects stored before name-derived UUIDs need a filtered scan
+                run_query = lambda: test_cases.query.fetch_objects(
+                    filters=Filter.by_property("name").equal(name),
+                    limit=limit,
                     return_properties=properties
                 )
+            results = retry(run_query, exceptions=_TRANSIENT_ERRORS)
             
             if results.objects:
                 self.logger.info("✅ Successfully retrieved test case(s)")
@@ -387,11 +781,17 @@ class WeaviateIntegration:
                         'properties': obj.properties,
                         'score': obj.metadata.distance
                     } for obj in results.objects]
+                self._lookup_cache.set(cache_key, results.objects[0].properties)
                 return results.objects[0].properties
+
+            # Misses are not cached: a replica read at ConsistencyLevel.ONE may
+            # not have seen a recent write yet
+            if not semantic:
+                self.logger.info("No test case found")
             return None
 
         except Exception as e:
-            self.logger.error(f"Error retrieving test case: {str(e)}")
+            self.logger.error("Error retrieving test case: %s", e)
             raise
 
     def search_similar_test_cases(self, query: str, limit: int = 5) -> List[Dict]:
@@ -1,5 +1,28 @@
+import hashlib
 import logging
+import orjson
 from weaviate.collections.classes.config import Configure, Property, DataType
+from weaviate.classes.query import Filter
+
+# TestCase collection properties as (name, data type) pairs
+TEST_CASE_PROPERTIES = (
+    ("name", DataType.TEXT),
+    ("description", DataType.TEXT),
+    ("requirement", DataType.TEXT),
+    ("precondition", DataType.TEXT),
+    ("steps", DataType.TEXT_ARRAY),
+    ("expected_results", DataType.TEXT_ARRAY),
+    ("priority", DataType.TEXT),
+    ("tags", DataType.TEXT_ARRAY),
+    ("automation_status", DataType.TEXT),
+    ("created_at", DataType.DATE),
+    ("updated_at", DataType.DATE),
+)
+
+# Stable hash of the property list, stored in Metadata to detect schema drift
+SCHEMA_FINGERPRINT = hashlib.sha1(
+    orjson.dumps([(name, data_type.value) for name, data_type in TEST_CASE_PROPERTIES])
+).hexdigest()
 
 class WeaviateSchema:
     def __init__(self, client):
@@ -21,9 +44,11 @@ class WeaviateSchema:
             if not self.client.collections.exists("Metadata"):
                 self._create_metadata_schema()
                 self._store_schema_version()
+            else:
+                self._check_fingerprint()
                 
         except Exception as e:
-            self.logger.error(f"Schema initialization failed: {e}")
+            self.logger.error("Schema initialization failed: %s", e)
             raise
 
     def _create_test_case_schema(self):
@@ -31,17 +56,8 @@ class WeaviateSchema:
         self.client.collections.create(
             name="TestCase",
             properties=[
-                Property(name="name", data_type=DataType.TEXT),
-                Property(name="description", data_type=DataType.TEXT),
-                Property(name="requirement", data_type=DataType.TEXT),
-                Property(name="precondition", data_type=DataType.TEXT),
-                Property(name="steps", data_type=DataType.TEXT_ARRAY),
-                Property(name="expected_results", data_type=DataType.TEXT_ARRAY),
-                Property(name="priority", data_type=DataType.TEXT),
-                Property(name="tags", data_type=DataType.TEXT_ARRAY),
-                Property(name="automation_status", data_type=DataType.TEXT),
-                Property(name="created_at", data_type=DataType.DATE),
-                Property(name="updated_at", data_type=DataType.DATE)
+                Property(name=name, data_type=data_type)
+                for name, data_type in TEST_CASE_PROPERTIES
             ]
         )
 
@@ -56,9 +72,21 @@ class WeaviateSchema:
         )
 
     def _store_schema_version(self):
-        """Store current schema version in metadata"""
+        """Store current schema version and fingerprint in metadata"""
         metadata = self.client.collections.get("Metadata")
-        metadata.data.insert({
-            "key": "schema_version",
-            "value": self.current_version
-        }) 
\ No newline at end of file
+        metadata.data.insert_many([
+            {"key": "schema_version", "value": self.current_version},
+            {"key": "schema_fingerprint", "value": SCHEMA_FINGERPRINT}
+        ])
+
+    def _check_fingerprint(self):
+        """Warn when the stored schema fingerprint differs from the code's"""
+        metadata = self.client.collections.get("Metadata")
+        result = metadata.query.fetch_objects(
+            filters=Filter.by_property("key").equal("schema_fingerprint"),
+            limit=1
+        )
+        if not result.objects:
+            metadata.data.insert({"key": "schema_fingerprint", "value": SCHEMA_FINGERPRINT})
+        elif result.objects[0].properties["value"] != SCHEMA_FINGERPRINT:
+            self.logger.warning("TestCase schema differs from the stored fingerprint; migration may be needed")
@@ -1,11 +1,51 @@
 """Zephyr Scale integration for test case management."""
 import os
 import logging
-import json
-from typing import Dict, List, Any, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from typing import Dict, Iterator, List, Any, Optional
+import orjson
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from pydantic import BaseModel
 
+_logger = logging.getLogger(__name__)
+_handler_lock = threading.Lock()
+
+def _enable_debug_logging():
+    """Attach the verbose console handler to the module logger exactly once"""
+    with _handler_lock:
+        if _logger.handlers:
+            return
+        _logger.setLevel(logging.DEBUG)
+        console_handler = logging.StreamHandler()
+        console_handler.setLevel(logging.DEBUG)
+        formatter = logging.Formatter('%(asctime)s - ZEPHYR - %(levelname)s - %(message)s')
+        console_handler.setFormatter(formatter)
+        _logger.addHandler(console_handler)
+
+# Keep-alive connection pool shared by every ZephyrIntegration session
+_ADAPTER = HTTPAdapter(
+    pool_connections=4,
+    pool_maxsize=32,
+    max_retries=Retry(
+        total=3,
+        backoff_factor=0.5,
+        status_forcelist=(429, 500, 502, 503, 504)
+    )
+)
+
+def _format_step(step: Dict[str, str]) -> Dict[str, str]:
+    """Map a test step onto the field names the Zephyr Scale API expects"""
+    get = step.get
+    return {
+        "description": get("step", ""),
+        "testData": get("test_data", ""),
+        "expectedResult": get("expected_result", "")
+    }
+
 class ZephyrTestCase(BaseModel):
     """Model for Zephyr Scale test case"""
     name: str
@@ -19,28 +59,44 @@ class ZephyrIntegration:
     """Handles interaction with Zephyr Scale API"""
 
     def __init__(self):
-        """Initialize Zephyr Scale client with configuration"""
-        # Configure logger
-        self.logger = logging.getLogger(__name__)
-        self.logger.setLevel(logging.DEBUG)
-
-        # Add console handler if not already added
-        if not self.logger.handlers:
-            console_handler = logging.StreamHandler()
-            console_handler.setLevel(logging.DEBUG)
-            formatter = logging.Formatter('%(asctime)s - ZEPHYR - %(levelname)s - %(message)s')
-            console_handler.setFormatter(formatter)
-            self.logger.addHandler(console_handler)
+        """Initialize Zephyr Scale client with configuration
+
+        Each instance gets its own session on the module-wide connection pool.
+        """
+        # Verbose request/response logging is opt-in via ZEPHYR_DEBUG=1
+        self._debug = os.environ.get("ZEPHYR_DEBUG") == "1"
+        self.logger = _logger
+        if self._debug:
+            _enable_debug_logging()
 
         self.api_key = os.environ.get("ZEPHYR_API_KEY")
         self.project_key = os.environ.get("ZEPHYR_PROJECT_KEY", "QADEMO")
         self.base_url = "https://api.zephyrscale.smartbear.com/v2"
+        # Fields shared by every test case created from this instance
+        self._payload_base = {
+            "projectKey": self.project_key,
+            "statusName": "Draft"
+        }
+        self._session = self._build_session()
 
         if not self.api_key:
             self.logger.warning("⚠️ ZEPHYR_API_KEY not set in environment variables")
         else:
             self.logger.info("✅ Zephyr Scale integration initialized with API key")
 
+    def _build_session(self) -> requests.Session:
+        """Create a session for Zephyr on top of the shared connection pool
+
+        The session is private to this instance, so its Authorization header
+        is only ever sent to Zephyr.
+        """
+        session = requests.Session()
+        session.mount("https://", _ADAPTER)
+        session.headers["Accept"] = "application/json"
+        if self.api_key:
+            session.headers["Authorization"] = f"Bearer {self.api_key}"
+        return session
+
     def create_test_case(self, test_case: ZephyrTestCase) -> Optional[str]:
         """Create a test case in Zephyr Scale"""
         try:
@@ -48,30 +104,15 @@ class ZephyrIntegration:
                 self.logger.error("❌ Cannot create test case: ZEPHYR_API_KEY not set")
                 return None
 
-            self.logger.info(f"📝 Creating test case in Zephyr Scale: {test_case.name}")
-
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Content-Type": "application/json"
-            }
+            self.logger.info("📝 Creating test case in Zephyr Scale: %s", test_case.name)
 
-            # Format steps for Zephyr Scale
-            formatted_steps = []
-            for step in test_case.steps:
-                formatted_step = {
-                    "description": step.get("step", ""),
-                    "testData": step.get("test_data", ""),
-                    "expectedResult": step.get("expected_result", "")
-                }
-                self.logger.debug(f"Step formatted: {json.dumps(formatted_step, indent=2)}")
-                formatted_steps.append(formatted_step)
+            formatted_steps = list(map(_format_step, test_case.steps))
 
             payload = {
-                "projectKey": self.project_key,
+                **self._payload_base,
                 "name": test_case.name,
                 "objective": test_case.objective,
                 "priorityName": test_case.priority.upper(),
-                "statusName": "Draft",
                 "steps": formatted_steps
             }
 
@@ -82,33 +123,52 @@ class ZephyrIntegration:
                 payload["labels"] = test_case.labels
 
             self.logger.info("🚀 Sending request to Zephyr Scale API")
-            self.logger.debug(f"Request payload: {json.dumps(payload, indent=2)}")
+            body = orjson.dumps(payload)
+            if self._debug:
+                self.logger.debug("Request payload: %s", orjson.dumps(payload, option=orjson.OPT_INDENT_2).decode())
 
-            response = requests.post(
+            response = self._session.post(
                 f"{self.base_url}/testcases",
-                headers=headers,
-                json=payload,
+                headers={"Content-Type": "application/json"},
+                data=body,
                 timeout=30
             )
 
-            self.logger.info(f"📨 Zephyr Scale response status: {response.status_code}")
-            self.logger.debug(f"Response body: {response.text}")
+            self.logger.info("📨 Zephyr Scale response status: %s", response.status_code)
+            if self._debug:
+                self.logger.debug("Response body: %s", response.text)
 
             if response.status_code in (200, 201):
-                result = response.json()
-                self.logger.info(f"✅ Successfully created test case in Zephyr Scale: {result.get('key')}")
+                result = orjson.loads(response.content)
+                self.logger.info("✅ Successfully created test case in Zephyr Scale: %s", result.get('key'))
                 return result.get("key")
             else:
-                self.logger.error(f"❌ Failed to create test case in Zephyr Scale: {response.text}")
+                self.logger.error("❌ Failed to create test case in Zephyr Scale: %s", response.text)
                 return None
 
         except requests.exceptions.RequestException as e:
-            self.logger.error(f"❌ Network error creating test case in Zephyr Scale: {str(e)}")
+            self.logger.error("❌ Network error creating test case in Zephyr Scale: %s", e)
             return None
         except Exception as e:
-            self.logger.error(f"❌ Error creating test case in Zephyr Scale: {str(e)}")
+            self.logger.error("❌ Error creating test case in Zephyr Scale: %s", e)
             return None
 
+    def create_test_cases(self, test_cases: List[ZephyrTestCase], concurrency: int = 8) -> List[Optional[str]]:
+        """Create several test cases in Zephyr Scale concurrently
+
+        Args:
+            test_cases: Test cases to create
+            concurrency: Maximum number of requests in flight
+
+        Returns:
+            list: Zephyr key for each test case, or None where creation failed
+        """
+        if not test_cases:
+            return []
+
+        with ThreadPoolExecutor(max_workers=min(concurrency, len(test_cases))) as pool:
+            return list(pool.map(self.create_test_case, test_cases))
+
     def get_test_case(self, key: str) -> Optional[Dict[str, Any]]:
         """Retrieve a test case from Zephyr Scale by key
         
@@ -123,64 +183,76 @@ class ZephyrIntegration:
                 self.logger.error("Cannot get test case: ZEPHYR_API_KEY not set")
                 return None
 
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Accept": "application/json"
-            }
-
-            response = requests.get(
-                f"{self.base_url}/testcases/{key}",
-                headers=headers
-            )
+            response = self._session.get(f"{self.base_url}/testcases/{key}")
 
             if response.status_code == 200:
                 return response.json()
             else:
-                self.logger.error(f"Failed to get test case from Zephyr Scale: {response.text}")
+                self.logger.error("Failed to get test case from Zephyr Scale: %s", response.text)
                 return None
 
         except Exception as e:
-            self.logger.error(f"Error getting test case from Zephyr Scale: {str(e)}")
+            self.logger.error("Error getting test case from Zephyr Scale: %s", e)
             return None
 
-    def search_test_cases(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
-        """Search for test cases in Zephyr Scale
-        
+    def iter_test_cases(self, query: str, page_size: int = 50) -> Iterator[Dict[str, Any]]:
+        """Lazily page through test cases in Zephyr Scale matching a query
+
+        Each page is fetched only once the previous one has been consumed, so
+        callers can stop early without downloading the full result set.
+
         Args:
             query: Search query string
-            max_results: Maximum number of results to return
-            
-        Returns:
-            list: List of matching test cases
+            page_size: Number of test cases requested per page
+
+        Yields:
+            dict: Matching test cases, in Zephyr's result order
         """
-        try:
-            if not self.api_key:
-                self.logger.error("Cannot search test cases: ZEPHYR_API_KEY not set")
-                return []
+        if not self.api_key:
+            self.logger.error("Cannot search test cases: ZEPHYR_API_KEY not set")
+            return
 
-            headers = {
-                "Authorization": f"Bearer {self.api_key}",
-                "Accept": "application/json"
-            }
+        offset = 0
 
+        while True:
             params = {
                 "projectKey": self.project_key,
                 "text": query,
-                "maxResults": max_results
+                "startAt": offset,
+                "maxResults": page_size
             }
 
-            response = requests.get(
+            response = self._session.get(
                 f"{self.base_url}/testcases/search",
-                headers=headers,
                 params=params
             )
 
-            if response.status_code == 200:
-                return response.json()["values"]
-            else:
-                self.logger.error(f"Failed to search test cases in Zephyr Scale: {response.text}")
-                return []
+            if response.status_code != 200:
+                self.logger.error("Failed to search test cases in Zephyr Scale: %s", response.text)
+                return
+
+            page = response.json()
+            values = page.get("values", [])
+            yield from values
+
+            if page.get("isLast") or len(values) < page_size:
+                return
+            offset += page_size
+
+    def search_test_cases(self, query: str, max_results: int = 10) -> List[Dict[str, Any]]:
+        """Search for test cases in Zephyr Scale
+        
+        Args:
+            query: Search query string
+            max_results: Maximum number of results to return
+            
+        Returns:
+            list: List of matching test cases
+        """
+        try:
+            page_size = min(max_results, 50) or 1
+            return list(islice(self.iter_test_cases(query, page_size=page_size), max_results))
 
         except Exception as e:
-            self.logger.error(f"Error searching test cases in Zephyr Scale: {str(e)}")
-            return []
\ No newline at end of file
+            self.logger.error("Error searching test cases in Zephyr Scale: %s", e)
+            return []
@@ -3,25 +3,25 @@ import logging
 import os
 from app import app
 
-# Configure logging
-logging.basicConfig(
-    level=logging.DEBUG,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
-)
+# Logging is configured by app on import
 logger = logging.getLogger(__name__)
 
 if __name__ == "__main__":
     try:
         # Get port from environment variable
         port = int(os.environ.get('PORT', 5000))
-        logger.info(f"Starting Flask server on port {port}")
+        logger.info("Starting Flask server on port %s", port)
+
+        # Debugger and reloader are for local development only
+        debug = os.environ.get('FLASK_ENV') == 'development'
 
         # Configure server for Replit
         app.run(
             host='0.0.0.0',  # Listen on all available interfaces
             port=port,
-            debug=True
+            debug=debug,
+            use_reloader=debug
         )
     except Exception as e:
-        logger.error(f"Failed to start server: {str(e)}", exc_info=True)
+        logger.error("Failed to start server: %s", e, exc_info=True)
         raise
\ No newline at end of file
@@ -10,24 +10,23 @@ def list_all_test_cases():
     """List all test cases stored in Weaviate"""
     try:
         client = WeaviateIntegration()
+        collection = client.client.collections.get("TestCase")
         
         # Query all test cases
-        result = (
-            client.client.query
-            .get("TestCase", ["name", "description", "steps", "expectedResults"])
-            .do()
+        result = collection.query.fetch_objects(
+            return_properties=["name", "description", "steps", "expected_results"]
         )
         
-        if result and "data" in result and "Get" in result["data"]:
-            test_cases = result["data"]["Get"]["TestCase"]
-            logger.info("Found %d test cases:", len(test_cases))
+        if result.objects:
+            logger.info("Found %d test cases:", len(result.objects))
             
-            for case in test_cases:
+            for obj in result.objects:
+                case = obj.properties
                 logger.info("\n=== Test Case ===")
                 logger.info("Name: %s", case.get('name'))
                 logger.info("Description: %s", case.get('description'))
                 logger.info("Steps: %s", case.get('steps'))
-                logger.info("Expected Results: %s", case.get('expectedResults'))
+                logger.info("Expected Results: %s", case.get('expected_results'))
                 logger.info("================\n")
         else:
             logger.info("No test cases found in Weaviate")
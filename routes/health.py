@@ -1,18 +1,31 @@
-from flask import jsonify
 from flask import current_app
 from flask import Blueprint
-from integrations.weaviate_schema import WeaviateSchema
+from flask import request
+from integrations.cache import TTLCache
+from integrations.weaviate_integration import WeaviateIntegration
+from routes.responses import json_response
 
 health_bp = Blueprint('health', __name__)
 
+# Last healthy payload; liveness probes within the TTL reuse it. The TTL
+# matches the client's own health check, so an outage shows up as quickly
+_cache = TTLCache(maxsize=1, ttl=WeaviateIntegration.HEALTH_TTL)
+
 @health_bp.route('/api/health')
 def health_check():
+    force = request.args.get('force') == '1'
+    if not force:
+        cached = _cache.get("payload")
+        if cached is not None:
+            return json_response(cached)
+
     try:
         weaviate_client = current_app.config.get('weaviate_client')
         if not weaviate_client:
             raise Exception("Weaviate client not initialized")
             
-        schema_manager = WeaviateSchema(weaviate_client.client)
+        # Reuse the schema manager created when the client connected
+        schema_manager = weaviate_client.schema_manager
         
         schema_status = {
             'collections': {
@@ -22,16 +35,19 @@ def health_check():
             'version': schema_manager.current_version
         }
         
-        return jsonify({
+        payload = {
             'weaviate': {
                 'connected': True,
                 'schema': schema_status
             }
-        })
+        }
+        _cache.set("payload", payload)
+        return json_response(payload)
     except Exception as e:
-        return jsonify({
+        _cache.pop("payload")
+        return json_response({
             'weaviate': {
                 'connected': False,
                 'error': str(e)
             }
-        }), 503 
\ No newline at end of file
+        }, 503) 
\ No newline at end of file
@@ -0,0 +1,31 @@
+"""JSON response helpers shared by the route modules"""
+import orjson
+from flask import Response
+
+def json_response(data, status: int = 200) -> Response:
+    """Serialize data with orjson into a JSON response
+
+    Args:
+        data: JSON-serializable payload
+        status: HTTP status code
+
+    Returns:
+        Response: application/json response carrying the encoded payload
+    """
+    return Response(
+        orjson.dumps(data, option=orjson.OPT_NON_STR_KEYS),
+        status=status,
+        mimetype='application/json'
+    )
+
+def raw_json_response(body: bytes, status: int = 200) -> Response:
+    """Wrap an already encoded JSON body in a response
+
+    Args:
+        body: UTF-8 encoded JSON document
+        status: HTTP status code
+
+    Returns:
+        Response: application/json response carrying body unchanged
+    """
+    return Response(body, status=status, mimetype='application/json')
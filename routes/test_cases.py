@@ -1,76 +1,472 @@
 """Routes for test case management"""
+import hashlib
 import logging
 import os
-from flask import Blueprint, request, jsonify, current_app, render_template
+import threading
+import uuid
+from typing import Annotated, List, Optional
+from concurrent.futures import ThreadPoolExecutor, TimeoutError as FutureTimeoutError, as_completed
+import orjson
+from flask import Blueprint, Response, current_app, request, render_template
+from pydantic import BaseModel, Field, StringConstraints, ValidationError
 from agents.requirement_input import RequirementInput, RequirementInputAgent
 from agents.nlp_parsing import NLPParsingAgent
+from integrations.cache import TTLCache
 from integrations.models import TestCase
-from integrations.weaviate_integration import WeaviateIntegration
-from weaviate.classes.query import MetadataQuery
+from integrations.weaviate_integration import SearchType
+from integrations.zephyr_integration import ZephyrIntegration, ZephyrTestCase
+from routes.responses import json_response, raw_json_response
 
-# Configure logging
-logging.basicConfig(level=logging.DEBUG)
 logger = logging.getLogger(__name__)
 
 # Create blueprint
 test_cases_bp = Blueprint('test_cases', __name__)
 
+# Most requirements accepted by one batch request, and the threads that parse them
+MAX_BATCH_SIZE = 100
+_parse_pool = ThreadPoolExecutor(max_workers=10, thread_name_prefix="parse")
+
+# Static head of the create response; the test case and closing brace follow
+_CREATED_PREFIX = b'{"message":"Test case created successfully","test_case":'
+_ACCEPTED_PREFIX = b'{"message":"Test case accepted for storage","test_case":'
+
+# Fixed error bodies, encoded once at import
+_ERR_NOT_JSON = orjson.dumps({'error': 'Content type must be application/json'})
+_ERR_NO_REQUIREMENT = orjson.dumps({'error': 'Requirement is required'})
+_ERR_INVALID_BODY = orjson.dumps({'error': 'Invalid request body'})
+_ERR_NOT_STORED = orjson.dumps({'error': 'Failed to store test case'})
+_ERR_BAD_BATCH = orjson.dumps({
+    'error': f'Body must be {{"items": [{{"requirement": ...}}, ...]}} with 1-{MAX_BATCH_SIZE} items'
+})
+_ERR_NO_QUERY = orjson.dumps({'error': 'Search query is required'})
+_ERR_BAD_LIMIT = orjson.dumps({'error': 'limit must be an integer'})
+_ERR_NOT_FOUND = orjson.dumps({'error': 'Test case not found'})
+_ERR_UNAVAILABLE = orjson.dumps({'error': 'Weaviate is not available'})
+_DUPLICATE_ERROR = 'A test case with this name already exists'
+
+class CreateTestCaseRequest(BaseModel):
+    """Body of a create test case request"""
+    requirement: Annotated[str, StringConstraints(strip_whitespace=True, min_length=1)]
+    project_key: Optional[str] = None
+
+class CreateTestCasesBatchRequest(BaseModel):
+    """Body of a batch create request"""
+    items: List[CreateTestCaseRequest] = Field(min_length=1, max_length=MAX_BATCH_SIZE)
+
+# Properties shown in search results; the rest stay on the server
+_SEARCH_PROPERTIES = (
+    "name", "description", "steps",
+    "expected_results", "tags", "priority"
+)
+
+# Zephyr client and agents shared by every request, built on first use
+_shared_lock = threading.Lock()
+_shared_instances = {}
+
+def _shared(factory):
+    """Return the process-wide instance built by factory, creating it once"""
+    instance = _shared_instances.get(factory)
+    if instance is None:
+        with _shared_lock:
+            instance = _shared_instances.get(factory)
+            if instance is None:
+                instance = _shared_instances[factory] = factory()
+    return instance
+
+def _get_weaviate():
+    """Return the Weaviate client the app connected at startup
+
+    Returns None while Weaviate is unavailable. Routes never connect on their
+    own; the app retries a failed connection every INIT_RETRY_INTERVAL
+    seconds. Must be called on the request thread, since it reads the app
+    config.
+    """
+    return current_app.config.get('weaviate_client')
+
+# Encoded search results keyed by (source, normalized query, limit)
+SEARCH_CACHE_SIZE = int(os.environ.get("SEARCH_CACHE_MAX", 1024))
+SEARCH_CACHE_TTL = float(os.environ.get("SEARCH_CACHE_TTL", 300))
+SEARCH_MISS_TTL = 10
+_search_cache = TTLCache(maxsize=SEARCH_CACHE_SIZE, ttl=SEARCH_CACHE_TTL)
+
+def _search_key(source, query, limit):
+    """Build a cache key that ignores case and differences in whitespace"""
+    normalized = " ".join(query.casefold().split())
+    digest = hashlib.blake2b(normalized.encode(), digest_size=16).hexdigest()
+    return (source, digest, limit)
+
+# Shared default for missing list fields; results are encoded, never mutated
+_EMPTY = ()
+
+def _search_weaviate(client, query, limit):
+    """Run a semantic search in Weaviate and shape the matches for the API"""
+    response = client.search_test_cases(
+        query,
+        search_type=SearchType.SEMANTIC,
+        properties=_SEARCH_PROPERTIES,
+        limit=limit
+    )
+
+    return [
+        {
+            'name': properties['name'],
+            'description': properties['description'],
+            'steps': properties['steps'],
+            'expected_results': properties.get('expected_results', _EMPTY),
+            'tags': properties.get('tags', _EMPTY),
+            'priority': properties.get('priority', 'Medium'),
+            'relevance_score': 1 - match['score']
+        }
+        for match in response['results']
+        for properties in (match['properties'],)
+    ]
+
+def _search_zephyr(client, query, limit):
+    """Run a text search in Zephyr Scale and shape the matches for the API"""
+    return [
+        {
+            'source': 'zephyr',
+            'key': case.get('key'),
+            'name': case.get('name'),
+            'description': case.get('objective') or '',
+            'tags': case.get('labels') or []
+        }
+        for case in client.search_test_cases(query, max_results=limit)
+    ]
+
+# Search backends by name: (client getter, search function); getters run on the request thread
+_SEARCH_BACKENDS = {
+    'weaviate': (_get_weaviate, _search_weaviate),
+    'zephyr': (lambda: _shared(ZephyrIntegration), _search_zephyr)
+}
+
+# Accepted values of the source parameter and the backends each one searches
+_SEARCH_SOURCES = {name: (name,) for name in _SEARCH_BACKENDS}
+_SEARCH_SOURCES['all'] = tuple(_SEARCH_BACKENDS)
+
+DEFAULT_SEARCH_LIMIT = 5
+MAX_SEARCH_LIMIT = 100
+
+# Searches across several backends, and Zephyr creates for queued writes, run on these threads
+SEARCH_TIMEOUT = 5.0
+_io_pool = ThreadPoolExecutor(max_workers=8, thread_name_prefix="remote-io")
+
+def _cached_search(client, source, query, limit):
+    """Return encoded search results for query, reusing recent results for the same query
+
+    Results are cached already encoded, so a cache hit does no serialization.
+
+    Args:
+        client: Integration client for the source
+        source: Name of the backend being searched
+        query: Search query as typed by the user
+        limit: Maximum number of results
+
+    Returns:
+        tuple: Number of results, and the items of their JSON array as bytes
+            without the enclosing brackets
+    """
+    key = _search_key(source, query, limit)
+    cached = _search_cache.get(key)
+    if cached is None:
+        results = _SEARCH_BACKENDS[source][1](client, query, limit)
+        cached = (len(results), orjson.dumps(results, option=orjson.OPT_NON_STR_KEYS)[1:-1])
+        # Empty results may be an outage the backend swallowed; retry them sooner
+        _search_cache.set(key, cached, ttl=None if results else SEARCH_MISS_TTL)
+    return cached
+
+
+# Cleaned and parsed requirements keyed by (requirement text, project key), so
+# resubmitting the same requirement skips the LLM call
+PARSE_CACHE_SIZE = 512
+PARSE_CACHE_TTL = 3600
+_parse_cache = TTLCache(maxsize=PARSE_CACHE_SIZE, ttl=PARSE_CACHE_TTL)
+
+def _parse_requirement(requirement_text, project_key=None):
+    """Clean and parse a requirement, reusing the result for repeated submissions
+
+    Args:
+        requirement_text: Raw requirement text from the request
+        project_key: Project the test case is created for, if any
+
+    Returns:
+        tuple: (CleanedRequirement, ParsedTestCase)
+    """
+    key = (requirement_text, project_key)
+    parsed = _parse_cache.get(key)
+    if parsed is None:
+        req_input = RequirementInput(raw_text=requirement_text)
+        cleaned_req = _shared(RequirementInputAgent).clean_requirement(req_input)
+        logger.info("Cleaned requirement: %s", cleaned_req.title)
+
+        parsed_case = _shared(NLPParsingAgent).parse_requirement(cleaned_req)
+        logger.info("Generated test case: %s", parsed_case.name)
+
+        parsed = (cleaned_req, parsed_case)
+        _parse_cache.set(key, parsed)
+    return parsed
+
+def _stream_search(futures, errors):
+    """Yield a JSON search response, writing each backend's results as it finishes
+
+    Args:
+        futures: Map of pending search future to backend name
+        errors: Map of backend name to error for backends that were not searched
+
+    Yields:
+        bytes: Pieces of a {"results": [...], "total": n, "errors"?: {...}} document
+    """
+    yield b'{"results":['
+    total = 0
+    try:
+        for future in as_completed(futures, timeout=SEARCH_TIMEOUT):
+            name = futures[future]
+            try:
+                count, items = future.result()
+            except Exception as e:
+                logger.error("Search in %s failed: %s", name, e)
+                errors[name] = str(e)
+                continue
+            if count:
+                # Splice the encoded items into the open results array
+                yield (b',' if total else b'') + items
+                total += count
+    except FutureTimeoutError:
+        for future, name in futures.items():
+            if not future.done():
+                logger.warning("Search in %s timed out after %.1fs", name, SEARCH_TIMEOUT)
+                errors[name] = 'timed out'
+
+    tail = {'total': total}
+    if errors:
+        tail['errors'] = errors
+    yield b'],' + orjson.dumps(tail)[1:]
+
+def _to_test_case(cleaned_req, parsed_case):
+    """Build the stored TestCase from a cleaned and parsed requirement"""
+    # Fields were already validated by ParsedTestCase, so skip re-validation
+    return TestCase.model_construct(
+        name=parsed_case.name,
+        description=parsed_case.objective,
+        requirement=cleaned_req.description,
+        precondition=parsed_case.precondition,
+        steps=[step.step for step in parsed_case.steps],
+        expected_results=parsed_case.expected_results,
+        priority="High",
+        tags=["security", "authentication"],
+        automation_status="Not Started" if not parsed_case.automation_needed else "Recommended"
+    )
+
+def _to_zephyr_case(parsed_case, test_case):
+    """Build the Zephyr Scale test case matching a stored TestCase"""
+    return ZephyrTestCase.model_construct(
+        name=parsed_case.name,
+        objective=parsed_case.objective,
+        # ParsedTestCase uses the string "None" for a missing precondition
+        precondition=None if parsed_case.precondition == "None" else parsed_case.precondition,
+        steps=[
+            {'step': step.step, 'test_data': step.test_data, 'expected_result': step.expected_result}
+            for step in parsed_case.steps
+        ],
+        priority=test_case.priority,
+        labels=test_case.tags
+    )
+
+def _zephyr_on_stored(zephyr_client, zephyr_case):
+    """Build an on_stored callback that creates zephyr_case once Weaviate stores it
+
+    Used for queued writes, whose callbacks run on the ingest thread; the
+    Zephyr request is handed to _io_pool so the thread is not held up.
+    """
+    def on_stored(case_id):
+        try:
+            _io_pool.submit(zephyr_client.create_test_case, zephyr_case)
+        except RuntimeError:
+            # The pool is shut down while the final queued writes flush at exit
+            zephyr_client.create_test_case(zephyr_case)
+    return on_stored
+
+def _recorder(results, position):
+    """Build a store callback that saves the UUID it gets at results[position]"""
+    def record(case_id):
+        results[position] = case_id
+    return record
+
+def _summarize(test_case, case_id, zephyr_key=None):
+    """Shape a stored test case for the create responses"""
+    return {
+        'id': case_id,
+        'zephyr_key': zephyr_key,
+        'name': test_case.name,
+        'description': test_case.description,
+        'steps': test_case.steps,
+        'expected_results': test_case.expected_results,
+        'priority': test_case.priority,
+        'automation_status': test_case.automation_status
+    }
+
 @test_cases_bp.route('/api/v1/test-cases', methods=['POST'])
 def create_test_case():
     """Generate and store test case from requirement"""
     try:
-        data = request.get_json()
-        if not data or 'requirement' not in data:
-            return jsonify({'error': 'Requirement is required'}), 400
+        if not request.is_json:
+            return raw_json_response(_ERR_NOT_JSON, 400)
 
-        # Initialize agents and client
-        requirement_agent = RequirementInputAgent()
-        nlp_agent = NLPParsingAgent()
-        weaviate_client = WeaviateIntegration()
+        # Parse and validate straight from the raw body in one pass
+        try:
+            data = CreateTestCaseRequest.model_validate_json(request.get_data())
+        except ValidationError as e:
+            if any(err['loc'] == ('requirement',) for err in e.errors()):
+                return raw_json_response(_ERR_NO_REQUIREMENT, 400)
+            return raw_json_response(_ERR_INVALID_BODY, 400)
 
-        # 1. Clean requirement
-        req_input = RequirementInput(raw_text=data['requirement'])
-        cleaned_req = requirement_agent.clean_requirement(req_input)
-        logger.info(f"Cleaned requirement: {cleaned_req.title}")
+        weaviate_client = _get_weaviate()
+        if weaviate_client is None:
+            return raw_json_response(_ERR_UNAVAILABLE, 503)
 
-        # 2. Generate test case
-        parsed_case = nlp_agent.parse_requirement(cleaned_req)
-        logger.info(f"Generated test case: {parsed_case.name}")
+        # 1-2. Clean requirement and generate test case
+        cleaned_req, parsed_case = _parse_requirement(data.requirement, data.project_key)
 
         # 3. Convert to TestCase model
-        test_case = TestCase(
-            name=parsed_case.name,
-            description=parsed_case.objective,
-            requirement=cleaned_req.description,
-            precondition=parsed_case.precondition,
-            steps=[step.step for step in parsed_case.steps],
-            expected_results=parsed_case.expected_results,
-            priority="High",
-            tags=["security", "authentication"],
-            automation_status="Not Started" if not parsed_case.automation_needed else "Recommended"
-        )
+        test_case = _to_test_case(cleaned_req, parsed_case)
 
-        # 4. Store in Weaviate
-        case_id = weaviate_client.store_test_case(test_case.to_weaviate_format())
+        # 4. Store in Weaviate. When Zephyr Scale is configured, a queued write
+        # is created there by the ingest thread once it has been stored
+        zephyr_client = _shared(ZephyrIntegration)
+        queued = weaviate_client.queues_writes
+        on_stored = None
+        if zephyr_client.api_key and queued:
+            on_stored = _zephyr_on_stored(zephyr_client, _to_zephyr_case(parsed_case, test_case))
+        # A queued duplicate is reported later through the status route
+        duplicate_of = [None]
+        case_id = weaviate_client.store_test_case(
+            test_case.to_weaviate_format(),
+            on_stored=on_stored,
+            on_duplicate=None if queued else _recorder(duplicate_of, 0)
+        )
+        if duplicate_of[0]:
+            return json_response({'error': _DUPLICATE_ERROR, 'id': duplicate_of[0]}, 409)
         if not case_id:
-            return jsonify({'error': 'Failed to store test case'}), 500
-
-        return jsonify({
-            'message': 'Test case created successfully',
-            'test_case': {
-                'id': case_id,
-                'name': test_case.name,
-                'description': test_case.description,
-                'steps': test_case.steps,
-                'expected_results': test_case.expected_results,
-                'priority': test_case.priority,
-                'automation_status': test_case.automation_status
-            }
-        }), 201
+            return raw_json_response(_ERR_NOT_STORED, 500)
+
+        # 5. Mirror a confirmed synchronous write to Zephyr Scale, when configured
+        zephyr_key = None
+        if zephyr_client.api_key and not queued:
+            # A Zephyr failure is reported but does not fail the request
+            try:
+                zephyr_key = zephyr_client.create_test_case(_to_zephyr_case(parsed_case, test_case))
+            except Exception as e:
+                logger.error("Error creating test case in Zephyr Scale: %s", e)
+
+        # The new test case may belong in any cached result set
+        _search_cache.clear()
+
+        # Queued writes are confirmed later through the status route
+        if queued:
+            prefix, status = _ACCEPTED_PREFIX, 202
+        else:
+            prefix, status = _CREATED_PREFIX, 201
+
+        # Only the test case varies; the envelope around it is pre-encoded
+        body = prefix + orjson.dumps(_summarize(test_case, case_id, zephyr_key)) + b'}'
+        return raw_json_response(body, status)
+
+    except Exception as e:
+        logger.exception("Error creating test case")
+        return json_response({'error': str(e)}, 500)
+
+@test_cases_bp.route('/api/v1/test-cases/batch', methods=['POST'])
+def create_test_cases_batch():
+    """Generate and store test cases for several requirements in one request"""
+    try:
+        if not request.is_json:
+            return raw_json_response(_ERR_NOT_JSON, 400)
+
+        try:
+            data = CreateTestCasesBatchRequest.model_validate_json(request.get_data())
+        except ValidationError:
+            return raw_json_response(_ERR_BAD_BATCH, 400)
+
+        weaviate_client = _get_weaviate()
+        if weaviate_client is None:
+            return raw_json_response(_ERR_UNAVAILABLE, 503)
+
+        # 1-2. Clean and parse every requirement concurrently
+        parse_futures = [
+            _parse_pool.submit(_parse_requirement, item.requirement, item.project_key)
+            for item in data.items
+        ]
+        outcomes = []
+        parsed = []
+        for index, future in enumerate(parse_futures):
+            try:
+                cleaned_req, parsed_case = future.result()
+            except Exception as e:
+                logger.error("Error parsing requirement %d of batch: %s", index, e)
+                outcomes.append({'status': 'failed', 'error': str(e)})
+                continue
+            outcomes.append(None)
+            parsed.append((index, parsed_case, _to_test_case(cleaned_req, parsed_case)))
+
+        # 3. Store all parsed test cases in Weaviate with one request. As for
+        # single creates, queued writes reach Zephyr Scale from the ingest thread
+        zephyr_client = _shared(ZephyrIntegration)
+        queued = weaviate_client.queues_writes
+        on_stored = None
+        if zephyr_client.api_key and queued:
+            on_stored = [
+                _zephyr_on_stored(zephyr_client, _to_zephyr_case(parsed_case, test_case))
+                for _, parsed_case, test_case in parsed
+            ]
+        case_ids = [None] * len(parsed)
+        duplicate_of = [None] * len(parsed)
+        store_error = 'Failed to store test case'
+        if parsed:
+            try:
+                case_ids = weaviate_client.store_test_cases(
+                    [test_case.to_weaviate_format() for _, _, test_case in parsed],
+                    on_stored=on_stored,
+                    on_duplicate=None if queued else [
+                        _recorder(duplicate_of, position) for position in range(len(parsed))
+                    ]
+                )
+            except Exception as e:
+                logger.error("Error storing test case batch: %s", e)
+                store_error = str(e)
+
+        # 4. Mirror the confirmed synchronous writes to Zephyr Scale, when configured
+        zephyr_keys = [None] * len(parsed)
+        stored = [position for position, case_id in enumerate(case_ids) if case_id]
+        if stored and zephyr_client.api_key and not queued:
+            keys = zephyr_client.create_test_cases([
+                _to_zephyr_case(parsed[position][1], parsed[position][2]) for position in stored
+            ])
+            for position, zephyr_key in zip(stored, keys):
+                zephyr_keys[position] = zephyr_key
+
+        # Queued writes are only accepted; the status route reports when they land
+        stored_status = 'queued' if queued else 'created'
+        for (index, _, test_case), case_id, zephyr_key, existing_id in zip(
+            parsed, case_ids, zephyr_keys, duplicate_of
+        ):
+            if case_id:
+                outcomes[index] = {'status': stored_status, 'test_case': _summarize(test_case, case_id, zephyr_key)}
+            elif existing_id:
+                outcomes[index] = {'status': 'failed', 'error': _DUPLICATE_ERROR, 'id': existing_id}
+            else:
+                outcomes[index] = {'status': 'failed', 'error': store_error}
+
+        counts = {'created': 0, 'queued': 0, 'failed': 0}
+        for outcome in outcomes:
+            counts[outcome['status']] += 1
+        if counts['created'] or counts['queued']:
+            _search_cache.clear()
+
+        return json_response({'items': outcomes, **counts}, 202 if counts['queued'] else 200)
 
     except Exception as e:
-        logger.error(f"Error creating test case: {str(e)}", exc_info=True)
-        return jsonify({'error': str(e)}), 500
+        logger.exception("Error creating test case batch")
+        return json_response({'error': str(e)}, 500)
 
 @test_cases_bp.route('/api/v1/test-cases/search')
 def search_test_cases():
@@ -78,60 +474,91 @@ def search_test_cases():
     try:
         query = request.args.get('q')
         if not query:
-            return jsonify({'error': 'Search query is required'}), 400
-
-        weaviate_client = WeaviateIntegration()
-        collection = weaviate_client.client.collections.get("TestCase")
-
-        # Perform semantic search
-        response = collection.query.near_text(
-            query=query,
-            limit=5,
-            return_metadata=MetadataQuery(distance=True),
-            return_properties=[
-                "name", "description", "steps", 
-                "expected_results", "tags", "priority"
-            ]
-        )
+            return raw_json_response(_ERR_NO_QUERY, 400)
 
-        results = []
-        if response.objects:
-            for obj in response.objects:
-                results.append({
-                    'name': obj.properties['name'],
-                    'description': obj.properties['description'],
-                    'steps': obj.properties['steps'],
-                    'expected_results': obj.properties.get('expected_results', []),
-                    'tags': obj.properties.get('tags', []),
-                    'priority': obj.properties.get('priority', 'Medium'),
-                    'relevance_score': 1 - obj.metadata.distance
-                })
-
-        return jsonify({
-            'results': results,
-            'total': len(results)
-        }), 200
+        source = request.args.get('source', 'weaviate').casefold()
+        sources = _SEARCH_SOURCES.get(source)
+        if sources is None:
+            return json_response({'error': f'Unknown search source: {source}'}, 400)
+
+        try:
+            limit = max(1, min(int(request.args.get('limit', DEFAULT_SEARCH_LIMIT)), MAX_SEARCH_LIMIT))
+        except ValueError:
+            return raw_json_response(_ERR_BAD_LIMIT, 400)
+
+        clients = {name: _SEARCH_BACKENDS[name][0]() for name in sources}
+        errors = {}
+        if 'weaviate' in clients and clients['weaviate'] is None:
+            if len(sources) == 1:
+                return raw_json_response(_ERR_UNAVAILABLE, 503)
+            del clients['weaviate']
+            errors['weaviate'] = 'not available'
+
+        if len(sources) == 1:
+            count, items = _cached_search(clients[source], source, query, limit)
+            return raw_json_response(b'{"results":[%b],"total":%d}' % (items, count), 200)
+
+        # Query every backend concurrently; one failing does not sink the others
+        futures = {
+            _io_pool.submit(_cached_search, client, name, query, limit): name
+            for name, client in clients.items()
+        }
+        return Response(_stream_search(futures, errors), mimetype='application/json')
 
     except Exception as e:
-        logger.error(f"Error searching test cases: {str(e)}", exc_info=True)
-        return jsonify({'error': str(e)}), 500
+        logger.exception("Error searching test cases")
+        return json_response({'error': str(e)}, 500)
 
 # Optional: Get specific test case
 @test_cases_bp.route('/api/v1/test-cases/<case_id>', methods=['GET'])
 def get_test_case(case_id):
     """Get a specific test case by ID"""
     try:
-        weaviate_client = WeaviateIntegration()
+        weaviate_client = _get_weaviate()
+        if weaviate_client is None:
+            return raw_json_response(_ERR_UNAVAILABLE, 503)
+
         test_case = weaviate_client.get_test_case(case_id)
         
         if not test_case:
-            return jsonify({'error': 'Test case not found'}), 404
+            return raw_json_response(_ERR_NOT_FOUND, 404)
+
+        return json_response(test_case, 200)
+
+    except Exception as e:
+        logger.exception("Error retrieving test case %s", case_id)
+        return json_response({'error': str(e)}, 500)
+
+@test_cases_bp.route('/api/v1/test-cases/<case_id>/status', methods=['GET'])
+def get_test_case_status(case_id):
+    """Report whether a created test case has reached Weaviate
+
+    Pending and failed writes are only known to the process that queued
+    them, which is why gunicorn.conf.py refuses async inserts with more
+    than one worker.
+    """
+    try:
+        # Match the stored keys whatever case or hyphenation the client sent
+        case_id = str(uuid.UUID(case_id))
+    except ValueError:
+        return raw_json_response(_ERR_NOT_FOUND, 404)
+
+    try:
+        weaviate_client = _get_weaviate()
+        if weaviate_client is None:
+            return raw_json_response(_ERR_UNAVAILABLE, 503)
+
+        status = weaviate_client.write_status(case_id)
+        if status is None:
+            if not weaviate_client.get_test_case_by_id(case_id, properties=['name']):
+                return raw_json_response(_ERR_NOT_FOUND, 404)
+            status = 'stored'
 
-        return jsonify(test_case), 200
+        return json_response({'id': case_id, 'status': status}, 200)
 
     except Exception as e:
-        logger.error(f"Error retrieving test case: {str(e)}", exc_info=True)
-        return jsonify({'error': str(e)}), 500
+        logger.exception("Error retrieving status of test case %s", case_id)
+        return json_response({'error': str(e)}, 500)
 
 @test_cases_bp.route('/test-cases', methods=['GET'])
 def test_cases_page():
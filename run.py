@@ -1,26 +1,49 @@
 import webbrowser
-import subprocess
+import threading
+import socket
 import time
 import os
-import sys
+
+def wait_for_server(port, timeout=10.0):
+    """Poll until something accepts connections on port, up to timeout seconds
+
+    Returns:
+        bool: True once the port accepts a connection, False on timeout
+    """
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        try:
+            with socket.create_connection(('127.0.0.1', port), timeout=0.5):
+                return True
+        except OSError:
+            time.sleep(0.05)
+    return False
+
+def open_when_ready(port):
+    """Open the app in the browser as soon as the server is listening"""
+    if not wait_for_server(port):
+        print(f"Server did not start on port {port}; not opening the browser")
+        return
+    webbrowser.open(f'http://localhost:{port}')
 
 def main():
-    # Start Flask application in the background
-    flask_process = subprocess.Popen([sys.executable, 'app.py'])
-    
-    # Wait for the server to start
-    time.sleep(2)
-    
-    # Open the browser
-    webbrowser.open('http://localhost:5000')
-    
+    # Serve from this interpreter rather than starting a second one for app.py
+    from app import app
+
+    port = int(os.environ.get('PORT', 5000))
+
+    threading.Thread(target=open_when_ready, args=(port,), daemon=True).start()
+
     try:
-        # Keep the script running
-        flask_process.wait()
+        # The reloader would re-run this script in a child process
+        app.run(
+            host='0.0.0.0',
+            port=port,
+            debug=os.environ.get('FLASK_ENV') == 'development',
+            use_reloader=False
+        )
     except KeyboardInterrupt:
         print("\nShutting down...")
-        flask_process.terminate()
-        flask_process.wait()
 
 if __name__ == "__main__":
-    main() 
\ No newline at end of file
+    main()
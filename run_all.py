@@ -1,11 +1,11 @@
 import subprocess
 import sys
-import time
+import threading
 import webbrowser
 import os
-from dotenv import load_dotenv
 import logging
-import importlib
+import importlib.util
+from run import wait_for_server
 
 # Configure basic logging
 logging.basicConfig(
@@ -28,10 +28,10 @@ def check_dependencies():
     missing_packages = []
     
     for package_name, import_name in required_packages.items():
-        try:
-            importlib.import_module(import_name)
+        # find_spec locates the package without importing it
+        if importlib.util.find_spec(import_name) is not None:
             print(f"✅ {package_name}")  # Simplified log
-        except ImportError:
+        else:
             print(f"❌ {package_name}")  # Simplified log
             missing_packages.append(package_name)
     
@@ -40,6 +40,8 @@ def check_dependencies():
         try:
             for package in missing_packages:
                 subprocess.check_call([sys.executable, "-m", "pip", "install", package])
+            # Let this interpreter find the packages it just installed
+            importlib.invalidate_caches()
             logger.info("Successfully installed missing packages")
             return True
         except subprocess.CalledProcessError as e:
@@ -50,6 +52,7 @@ def check_dependencies():
 
 def check_env_vars():
     """Check if all required environment variables are set"""
+    from dotenv import load_dotenv
     load_dotenv()
     required_vars = [
         'OPENAI_API_KEY',
@@ -70,38 +73,35 @@ def main():
         logger.error("pip install -r requirements.txt")
         return
     
-    # Now that dependencies are installed, we can import dotenv
-    from dotenv import load_dotenv
-    
     # Check environment variables
     if not check_env_vars():
         logger.error("Missing environment variables. Please check .env file.")
         return
     
     try:
-        # Start Flask application
+        # Start Flask application in this interpreter rather than a second one
         logger.info("Starting Flask application...")
-        flask_process = subprocess.Popen([sys.executable, 'app.py'])
-        
-        # Wait for server to start
-        time.sleep(3)
-        
-        # Open browser
-        logger.info("Opening browser...")
-        webbrowser.open('http://localhost:5000')
-        
-        # Keep the script running
-        flask_process.wait()
-        
+        from app import app
+
+        port = int(os.environ.get('PORT', 5000))
+
+        def open_browser():
+            if not wait_for_server(port):
+                logger.error(f"Server did not start on port {port}; not opening the browser")
+                return
+            logger.info("Opening browser...")
+            webbrowser.open(f'http://localhost:{port}')
+
+        # Open browser as soon as the server accepts connections
+        threading.Thread(target=open_browser, daemon=True).start()
+
+        # The reloader would re-run this script in a child process
+        app.run(host='0.0.0.0', port=port, use_reloader=False)
+
     except KeyboardInterrupt:
         logger.info("\nShutting down...")
-        flask_process.terminate()
-        flask_process.wait()
     except Exception as e:
         logger.error(f"Error running application: {str(e)}")
-        if 'flask_process' in locals():
-            flask_process.terminate()
-            flask_process.wait()
 
 if __name__ == "__main__":
     main() 
\ No newline at end of file
@@ -59,7 +59,7 @@ def test_requirement_to_search():
             - Old password becomes invalid"""
         ]
         
-        stored_ids = []
+        test_cases = []
         # Process each requirement
         for raw_requirement in requirements:
             # 1. Clean requirement
@@ -84,10 +84,11 @@ def test_requirement_to_search():
                 automation_status="Not Started" if not parsed_case.automation_needed else "Recommended"
             )
             
-            # 4. Store in Weaviate
-            case_id = client.store_test_case(test_case.to_weaviate_format())
+            test_cases.append(test_case.to_weaviate_format())
+
+        # 4. Store all test cases in a single Weaviate batch
+        for case_id in client.store_test_cases(test_cases):
             if case_id:
-                stored_ids.append(case_id)
                 logger.info(f"✅ Test case stored with ID: {case_id}")
             else:
                 logger.error("❌ Failed to store test case")
@@ -0,0 +1,62 @@
+"""Test in-process TTL cache"""
+import pytest
+from integrations import cache as cache_module
+from integrations.cache import TTLCache
+
+@pytest.fixture
+def clock(monkeypatch):
+    """Controllable replacement for time.monotonic"""
+    now = [1000.0]
+    monkeypatch.setattr(cache_module.time, "monotonic", lambda: now[0])
+    return now
+
+def test_get_and_set():
+    """Test storing and retrieving values"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("login", {"name": "Login Test"})
+
+    assert cache.get("login") == {"name": "Login Test"}
+    assert cache.get("missing") is None
+    assert cache.get("missing", "default") == "default"
+
+def test_entries_expire(clock):
+    """Test entries expire after their TTL"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set("hit", 1)
+    cache.set("miss", 2, ttl=5)
+
+    clock[0] += 10
+    assert cache.get("miss") is None
+    assert cache.get("hit") == 1
+
+    clock[0] += 60
+    assert cache.get("hit") is None
+    assert len(cache) == 0
+
+def test_least_recently_used_is_evicted():
+    """Test cache evicts the least recently used entry when full"""
+    cache = TTLCache(maxsize=2, ttl=60)
+    cache.set("a", 1)
+    cache.set("b", 2)
+    cache.get("a")
+    cache.set("c", 3)
+
+    assert cache.get("a") == 1
+    assert cache.get("b") is None
+    assert cache.get("c") == 3
+
+def test_discard_if_and_clear():
+    """Test selective and full invalidation"""
+    cache = TTLCache(maxsize=10, ttl=60)
+    cache.set(("Login", ()), "hit")
+    cache.set(("Logout", ()), None)
+    cache.set(("Signup", ()), "hit")
+
+    removed = cache.discard_if(lambda key, value: value is None or key[0] == "Login")
+    assert removed == 2
+    assert cache.get(("Signup", ())) == "hit"
+    assert cache.pop(("Signup", ())) == "hit"
+
+    cache.set("x", 1)
+    cache.clear()
+    assert len(cache) == 0
@@ -0,0 +1,49 @@
+"""Test retry helper"""
+import pytest
+from integrations import retry as retry_module
+from integrations.retry import retry
+
+@pytest.fixture
+def sleeps(monkeypatch):
+    """Record requested sleeps instead of sleeping"""
+    recorded = []
+    monkeypatch.setattr(retry_module.time, "sleep", recorded.append)
+    return recorded
+
+def test_returns_first_success(sleeps):
+    """Test no retry happens when the call succeeds"""
+    assert retry(lambda: "ok") == "ok"
+    assert sleeps == []
+
+def test_retries_until_success(sleeps):
+    """Test failures are retried with capped delays"""
+    calls = []
+
+    def flaky():
+        calls.append(1)
+        if len(calls) < 3:
+            raise ConnectionError("network blip")
+        return "ok"
+
+    assert retry(flaky, attempts=3, base=0.25, cap=1.0) == "ok"
+    assert len(calls) == 3
+    assert len(sleeps) == 2
+    assert all(0.25 <= delay <= 1.0 for delay in sleeps)
+
+def test_gives_up_after_attempts(sleeps):
+    """Test the last error is raised once attempts are exhausted"""
+    def always_fails():
+        raise TimeoutError("still down")
+
+    with pytest.raises(TimeoutError):
+        retry(always_fails, attempts=2)
+    assert len(sleeps) == 1
+
+def test_non_retryable_errors_propagate(sleeps):
+    """Test exceptions outside the retry list are not retried"""
+    def bad_config():
+        raise ValueError("bad api key")
+
+    with pytest.raises(ValueError):
+        retry(bad_config, exceptions=(ConnectionError,))
+    assert sleeps == []
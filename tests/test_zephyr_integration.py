@@ -0,0 +1,38 @@
+"""Test Zephyr Scale integration"""
+from unittest.mock import MagicMock
+import pytest
+from integrations.zephyr_integration import ZephyrIntegration
+
+def _page(values, is_last=False):
+    response = MagicMock(status_code=200)
+    response.json.return_value = {"values": values, "isLast": is_last}
+    return response
+
+@pytest.fixture
+def zephyr(monkeypatch):
+    monkeypatch.setenv("ZEPHYR_API_KEY", "test-key")
+    client = ZephyrIntegration()
+    client._session = MagicMock()
+    return client
+
+def test_iter_test_cases_pages_until_short_page(zephyr):
+    """Test pagination advances startAt and stops on a short page"""
+    zephyr._session.get.side_effect = [
+        _page([{"key": "QA-1"}, {"key": "QA-2"}]),
+        _page([{"key": "QA-3"}])
+    ]
+
+    keys = [case["key"] for case in zephyr.iter_test_cases("login", page_size=2)]
+
+    assert keys == ["QA-1", "QA-2", "QA-3"]
+    offsets = [call.kwargs["params"]["startAt"] for call in zephyr._session.get.call_args_list]
+    assert offsets == [0, 2]
+
+def test_search_test_cases_stops_at_max_results(zephyr):
+    """Test search does not fetch pages beyond max_results"""
+    zephyr._session.get.return_value = _page([{"key": f"QA-{i}"} for i in range(3)])
+
+    results = zephyr.search_test_cases("login", max_results=3)
+
+    assert len(results) == 3
+    assert zephyr._session.get.call_count == 1
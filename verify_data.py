@@ -10,7 +10,7 @@ def verify_test_cases():
     try:
         # Get all test cases
         collection = client.client.collections.get("TestCase")
-        response = collection.query.get(
+        response = collection.query.fetch_objects(
             return_properties=[
                 "name", "description", "steps", 
                 "expected_results", "tags", "priority"